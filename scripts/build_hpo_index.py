@@ -0,0 +1,34 @@
+"""
+Build the flat HPO index used by HPO-symptom-standardize.ipynb.
+
+Parses hp.obo once (only the fields the notebook uses, see hpo_obo.py) and
+writes a gzipped pickle. The index records its layout format, HPO
+data-version and build time; the notebook rebuilds from hp.obo when any of
+these makes it unusable, so re-run this after each HPO release.
+
+Usage:
+    python scripts/build_hpo_index.py [--obo URL_OR_PATH] [--out PATH]
+"""
+import argparse
+import os
+
+from hpo_obo import parse_hpo_obo, read_obo_lines, write_index
+
+HPO_URL = "http://purl.obolibrary.org/obo/hp.obo"
+# Default output: the repo root, where the notebook looks for the index
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--obo", default=HPO_URL, help="hp.obo URL or local path")
+    parser.add_argument("--out", default=os.path.join(REPO_DIR, "hpo_index.pkl.gz"), help="output file")
+    args = parser.parse_args()
+
+    index = parse_hpo_obo(read_obo_lines(args.obo))
+    write_index(index, args.out)
+    print(f"Wrote {len(index['terms'])} terms (HPO {index['version']}) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
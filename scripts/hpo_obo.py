@@ -0,0 +1,108 @@
+"""
+Parse hp.obo into the flat HPO index shared by HPO-symptom-standardize.ipynb
+and scripts/build_hpo_index.py.
+
+Index layout (gzipped pickle):
+{"format": HPO_INDEX_FORMAT, "version": <HPO data-version>, "built_at": <epoch>,
+ "terms": {hpo_id: {"name", "synonyms", "definition", "parents"}}}
+"""
+import gzip
+import os
+import pickle
+import time
+from typing import Dict, Iterable
+
+import requests
+
+HPO_INDEX_FORMAT = 1  # bump when the index layout changes
+
+
+def _clean_obo_text(s: str) -> str:
+    # OBO annotation format often looks like:  "\"text\" EXACT [XREF:...]""
+    if isinstance(s, str) and '"' in s:
+        try:
+            return s.split('"', 2)[1]
+        except Exception:
+            return s
+    return s
+
+
+def read_obo_lines(source: str) -> Iterable[str]:
+    """Yield the lines of an OBO file from a URL or a local path."""
+    if source.startswith(("http://", "https://")):
+        with requests.get(source, stream=True, timeout=60) as resp:
+            resp.raise_for_status()
+            resp.encoding = "utf-8"
+            yield from resp.iter_lines(decode_unicode=True)
+    else:
+        with open(source, encoding="utf-8") as fh:
+            yield from fh
+
+
+def parse_hpo_obo(lines: Iterable[str]) -> Dict[str, object]:
+    """
+    Parse hp.obo into the plain-dict index (layout above).
+    - Reads only the [Term] fields used here (name, synonym, def, is_a).
+    - Skips obsolete terms.
+    - Synonyms and definitions are stored already cleaned of OBO quoting.
+    """
+    version = None
+    terms = {}
+    stanza = None  # fields of the current [Term]; None elsewhere
+
+    def _finish(st):
+        if st and st.get("id") and not st.get("obsolete"):
+            terms[st["id"]] = {
+                "name": st.get("name"),
+                "synonyms": st["synonyms"],
+                "definition": st.get("definition"),
+                "parents": st["parents"],
+            }
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("!"):
+            continue
+        if line.startswith("["):
+            _finish(stanza)
+            stanza = {"synonyms": [], "parents": []} if line == "[Term]" else None
+            continue
+        tag, sep, value = line.partition(": ")
+        if not sep:
+            continue
+        if stanza is None:
+            if tag == "data-version" and version is None:
+                version = value
+        elif tag == "id":
+            stanza["id"] = value
+        elif tag == "name":
+            stanza["name"] = value
+        elif tag == "synonym":
+            # e.g. "Drooping eyelid" EXACT layperson [ORCID:...]
+            stanza["synonyms"].append(_clean_obo_text(value))
+        elif tag == "def":
+            # e.g. "text" [PMID:...]
+            stanza["definition"] = _clean_obo_text(value)
+        elif tag == "is_a":
+            # e.g. HP:0000118 ! Phenotypic abnormality
+            stanza["parents"].append(value.split()[0])
+        elif tag == "is_obsolete":
+            stanza["obsolete"] = value == "true"
+    _finish(stanza)
+    return {
+        "format": HPO_INDEX_FORMAT,
+        "version": version,
+        "built_at": time.time(),
+        "terms": terms,
+    }
+
+
+def read_index(path: str) -> Dict[str, object]:
+    with gzip.open(path, "rb") as fh:
+        return pickle.load(fh)
+
+
+def write_index(index: Dict[str, object], path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with gzip.open(path, "wb") as fh:
+        pickle.dump(index, fh, protocol=pickle.HIGHEST_PROTOCOL)
@@ -0,0 +1,103 @@
+import json
+import os
+import sys
+import types
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, "scripts"))
+
+import hpo_obo  # noqa: E402
+
+SAMPLE_OBO = """\
+format-version: 1.2
+data-version: hp/releases/2025-09-01
+ontology: hp
+
+[Term]
+id: HP:0000001
+name: All
+
+[Term]
+id: HP:0000118
+name: Phenotypic abnormality
+is_a: HP:0000001 ! All
+
+[Term]
+id: HP:0000508
+name: Ptosis
+def: "The upper eyelid margin is positioned lower than normal." [HPO:probinson]
+synonym: "Drooping upper eyelid" EXACT layperson [ORCID:0000-0001-5208-3432]
+synonym: "Blepharoptosis" EXACT []
+is_a: HP:0000118 ! Phenotypic abnormality
+is_a: HP:0000001 {source="x"} ! All
+
+[Term]
+id: HP:0000002
+name: obsolete Abnormality of body height
+is_obsolete: true
+
+[Typedef]
+id: part_of
+name: part of
+is_a: HP:0000001
+"""
+
+
+@pytest.fixture
+def index():
+    return hpo_obo.parse_hpo_obo(SAMPLE_OBO.splitlines())
+
+
+def test_header_and_format(index):
+    assert index["version"] == "hp/releases/2025-09-01"
+    assert index["format"] == hpo_obo.HPO_INDEX_FORMAT
+    assert isinstance(index["built_at"], float)
+
+
+def test_skips_obsolete_terms_and_typedefs(index):
+    assert set(index["terms"]) == {"HP:0000001", "HP:0000118", "HP:0000508"}
+
+
+def test_multiple_is_a_keeps_order_and_drops_comments(index):
+    assert index["terms"]["HP:0000508"]["parents"] == ["HP:0000118", "HP:0000001"]
+    assert index["terms"]["HP:0000001"]["parents"] == []
+
+
+def test_unquotes_synonyms_and_definition(index):
+    term = index["terms"]["HP:0000508"]
+    assert term["name"] == "Ptosis"
+    assert term["synonyms"] == ["Drooping upper eyelid", "Blepharoptosis"]
+    assert term["definition"] == "The upper eyelid margin is positioned lower than normal."
+    assert index["terms"]["HP:0000001"]["definition"] is None
+
+
+def test_read_obo_lines_and_index_round_trip(tmp_path):
+    obo = tmp_path / "hp.obo"
+    obo.write_text(SAMPLE_OBO, encoding="utf-8")
+    index = hpo_obo.parse_hpo_obo(hpo_obo.read_obo_lines(str(obo)))
+
+    out = tmp_path / "sub" / "hpo_index.pkl.gz"
+    hpo_obo.write_index(index, str(out))
+    assert hpo_obo.read_index(str(out)) == index
+
+
+def test_notebook_inline_copy_matches_module():
+    # The notebook keeps an inline copy for runs outside the repo
+    with open(os.path.join(REPO_DIR, "HPO-symptom-standardize.ipynb"), encoding="utf-8") as fh:
+        cells = json.load(fh)["cells"]
+    src = next(
+        "".join(c["source"]) for c in cells
+        if c["cell_type"] == "code"
+        and "".join(c["source"]).startswith("# --- OBO parser / index I/O: inline copy")
+    )
+    inline = types.ModuleType("inline_hpo_obo")
+    exec(src, inline.__dict__)
+
+    assert inline.HPO_INDEX_FORMAT == hpo_obo.HPO_INDEX_FORMAT
+    expected = hpo_obo.parse_hpo_obo(SAMPLE_OBO.splitlines())
+    actual = inline.parse_hpo_obo(SAMPLE_OBO.splitlines())
+    for index in (expected, actual):
+        index.pop("built_at")
+    assert actual == expected